@@ -1,10 +1,94 @@
-from typing import List, Dict, Any, Optional
+from collections import deque
+from typing import Callable, List, Dict, Any, Optional, Tuple
 import logging
-from langchain.text_splitter import CharacterTextSplitter
 from src.core.document import Document
 
 logger = logging.getLogger(__name__)
 
+
+def _split_offsets(
+    text: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    separator: str,
+    length_function: Callable[[str], int] = len
+) -> List[Tuple[int, int]]:
+    """
+    Compute (start, end) offsets of chunks in a single pass over the text.
+    
+    Pieces between separators are merged greedily up to chunk_size, keeping
+    up to chunk_overlap of trailing pieces as the start of the next chunk.
+    Chunks are slices of the original text, so a run of repeated separators
+    between two pieces is kept and counted at its full length. Leading and
+    trailing whitespace is trimmed from each chunk and empty chunks are
+    dropped.
+    
+    Args:
+        text: Text to split
+        chunk_size: Maximum size of each chunk
+        chunk_overlap: Maximum overlap between consecutive chunks
+        separator: String separator to split on
+        length_function: Function to measure text length
+        
+    Returns:
+        List of (start, end) offsets into text, in document order
+    """
+    measure_slices = length_function is not len
+    step = len(separator)
+    text_len = len(text)
+    
+    offsets = []
+    # (start, end, length, gap) of pieces in the current chunk, where gap is
+    # the measured length of the separator run before the piece
+    window = deque()
+    total = 0
+    
+    def emit() -> None:
+        start, end = window[0][0], window[-1][1]
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if start < end:
+            offsets.append((start, end))
+    
+    pos = 0
+    while pos < text_len:
+        if step:
+            cut = text.find(separator, pos)
+            if cut == -1:
+                cut = text_len
+        else:
+            cut = pos + 1
+        
+        if cut > pos:
+            length = length_function(text[pos:cut]) if measure_slices else cut - pos
+            gap = 0
+            if window:
+                prev_end = window[-1][1]
+                gap = length_function(text[prev_end:pos]) if measure_slices else pos - prev_end
+            if window and total + length + gap > chunk_size:
+                if total > chunk_size:
+                    logger.warning(
+                        f"Created a chunk of size {total}, "
+                        f"which is longer than the specified {chunk_size}"
+                    )
+                emit()
+                # Drop pieces from the front until what is left fits as overlap
+                while total > chunk_overlap or (
+                    total + length + gap > chunk_size and total > 0
+                ):
+                    total -= window.popleft()[2] + (window[0][3] if window else 0)
+            window.append((pos, cut, length, gap))
+            total += length + (gap if len(window) > 1 else 0)
+        
+        pos = cut + step
+    
+    if window:
+        emit()
+    return offsets
+
+
 class TextChunker:
     """Class for handling text chunking operations."""
     
@@ -26,12 +110,15 @@ class TextChunker:
             length_function: Function to measure text length
             add_start_index: Whether to add chunk start index to metadata
         """
-        self.text_splitter = CharacterTextSplitter(
-            separator=separator,
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=length_function
-        )
+        if chunk_overlap > chunk_size:
+            raise ValueError(
+                f"Got a larger chunk overlap ({chunk_overlap}) than chunk size "
+                f"({chunk_size}), should be smaller."
+            )
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.separator = separator
+        self.length_function = length_function
         self.add_start_index = add_start_index
         logger.info(
             f"Initialized TextChunker with chunk_size={chunk_size}, "
@@ -56,36 +143,40 @@ class TextChunker:
             List of Document objects representing chunks
         """
         try:
-            # Update splitter parameters if provided
-            if chunk_size is not None:
-                self.text_splitter.chunk_size = chunk_size
-            if chunk_overlap is not None:
-                self.text_splitter.chunk_overlap = chunk_overlap
+            if chunk_size is None:
+                chunk_size = self.chunk_size
+            if chunk_overlap is None:
+                chunk_overlap = self.chunk_overlap
+            
+            # Split the text into chunk offsets and slice once at the end
+            content = document.content
+            offsets = _split_offsets(
+                content,
+                chunk_size,
+                chunk_overlap,
+                self.separator,
+                self.length_function
+            )
             
-            # Split the text
-            chunk_texts = self.text_splitter.split_text(document.content)
+            # Shared per-document values, computed once for all chunks
+            doc_id = document.doc_id
+            base_metadata = {**document.metadata, "total_chunks": len(offsets)}
             
             # Create new documents for chunks
             chunked_docs = []
-            for i, chunk_text in enumerate(chunk_texts):
+            for i, (start, end) in enumerate(offsets):
                 # Create new metadata dict for the chunk
-                chunk_metadata = document.metadata.copy()
-                
-                # Add chunk-specific metadata
-                chunk_metadata.update({
-                    "chunk_index": i,
-                    "total_chunks": len(chunk_texts),
-                })
+                chunk_metadata = {**base_metadata, "chunk_index": i}
                 
                 # Add start index if requested
                 if self.add_start_index:
-                    chunk_metadata["chunk_start_index"] = document.content.find(chunk_text)
+                    chunk_metadata["chunk_start_index"] = start
                 
                 # Create new Document for the chunk
                 chunk_doc = Document(
-                    content=chunk_text,
+                    content=content[start:end],
                     metadata=chunk_metadata,
-                    doc_id=f"{document.doc_id}_chunk_{i}" if document.doc_id else None
+                    doc_id=f"{doc_id}_chunk_{i}" if doc_id else None
                 )
                 chunked_docs.append(chunk_doc)
             
@@ -3,7 +3,7 @@
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """Base document class to store text content and metadata."""
     content: str
@@ -1,7 +1,10 @@
 import chromadb
+import numpy as np
 from chromadb.config import Settings
-from typing import List, Optional, Dict, Any, Tuple
-import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Deque, List, Optional, Dict, Any, Set, Tuple
+import os
 import logging
 from src.core.document import Document
 from ..connector import DBConnector, RetrievedChunk
@@ -11,10 +14,31 @@ logger = logging.getLogger(__name__)
 class ChromaConnector(DBConnector):
     """ChromaDB implementation of database connector."""
     
-    def __init__(self, persist_directory: str):
+    def __init__(
+        self,
+        persist_directory: str,
+        insert_batch_size: int = 1000,
+        insert_concurrency: int = 1,
+        max_pending_inserts: int = 4
+    ):
+        if insert_batch_size < 1:
+            raise ValueError("insert_batch_size must be a positive integer")
+        if insert_concurrency < 1:
+            raise ValueError("insert_concurrency must be a positive integer")
+        if max_pending_inserts < 1:
+            raise ValueError("max_pending_inserts must be a positive integer")
         self.persist_directory = persist_directory
+        self.insert_batch_size = insert_batch_size
+        self.insert_concurrency = insert_concurrency
+        self.max_pending_inserts = max_pending_inserts
         self.client = None
-        self.collections = {}
+        # collection name -> (collection handle, embedding dimension or None)
+        self._coll_cache: Dict[str, Tuple[Any, Optional[int]]] = {}
+        # Names of collections known to exist, loaded once on connect
+        self._known: Set[str] = set()
+        # Background insert worker used by add_to_collection_async
+        self._insert_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_inserts: Deque[Future] = deque()
 
     def connect(self) -> None:
         try:
@@ -25,14 +49,23 @@ class ChromaConnector(DBConnector):
                     allow_reset=True
                 )
             )
+            self._known = {
+                getattr(c, "name", c) for c in self.client.list_collections()
+            }
             logger.info("Connected to ChromaDB")
         except Exception as e:
             logger.error(f"Error connecting to ChromaDB: {e}")
             raise
 
     def disconnect(self) -> None:
+        # Let queued background inserts finish before dropping the client
+        self.flush()
+        if self._insert_executor is not None:
+            self._insert_executor.shutdown(wait=True)
+            self._insert_executor = None
         self.client = None
-        self.collections = {}
+        self._coll_cache = {}
+        self._known = set()
         logger.info("Disconnected from ChromaDB")
 
     def create_collection(self, collection_name: str) -> None:
@@ -40,14 +73,18 @@ class ChromaConnector(DBConnector):
             raise ConnectionError("Not connected to ChromaDB")
         
         try:
-            existing_collections = self.client.list_collections()
-            if collection_name in existing_collections:
+            # Queued background inserts must not race with the create
+            self.flush()
+            if collection_name in self._known:
                 logger.info(f"Collection {collection_name} already exists")
                 return
-            self.collections[collection_name] = self.client.create_collection(
-                name=collection_name
-            )
-            logger.info(f"Created collection: {collection_name}")
+            # The name set is a snapshot from connect(); another client may
+            # have created the collection since, so get-or-create on a miss.
+            # The handle is not cached here: _bind probes the dimension on
+            # first use, which matters if the collection already has data.
+            self.client.get_or_create_collection(name=collection_name)
+            self._known.add(collection_name)
+            logger.info(f"Created or found existing collection: {collection_name}")
         except Exception as e:
             logger.error(f"Error creating collection {collection_name}: {e}")
             raise
@@ -57,8 +94,12 @@ class ChromaConnector(DBConnector):
             raise ConnectionError("Not connected to ChromaDB")
         
         try:
+            # Finish queued background inserts first; one that ran after the
+            # delete would silently recreate the collection via _bind
+            self.flush()
             self.client.delete_collection(collection_name)
-            self.collections.pop(collection_name, None)
+            self._coll_cache.pop(collection_name, None)
+            self._known.discard(collection_name)
             logger.info(f"Dropped collection: {collection_name}")
         except Exception as e:
             logger.error(f"Error dropping collection {collection_name}: {e}")
@@ -69,46 +110,127 @@ class ChromaConnector(DBConnector):
             raise ConnectionError("Not connected to ChromaDB")
         
         try:
-            collections = self.client.list_collections()
+            # Older Chroma versions return Collection objects, newer ones names
+            collections = [
+                getattr(c, "name", c) for c in self.client.list_collections()
+            ]
+            self._known = set(collections)
             logger.info(f"Found {len(collections)} collections")
             return collections
         except Exception as e:
             logger.error(f"Error listing collections: {e}")
             raise
 
-    def get_collection(self, collection_name: str):
-        """Helper method to get or create collection reference."""
-        if collection_name not in self.collections:
-            self.collections[collection_name] = self.client.get_or_create_collection(
-                name=collection_name
-            )
-        return self.collections[collection_name]
+    def _bind(self, collection_name: str) -> Tuple[Any, Optional[int]]:
+        """
+        Get or create a collection and cache its (collection, dimension) pair.
+        
+        The connection is checked here rather than on every add or search:
+        disconnect() clears the cache, so cached entries imply a live client.
+        """
+        if not self.client:
+            raise ConnectionError("Not connected to ChromaDB")
+        
+        collection = self.client.get_or_create_collection(name=collection_name)
+        # Probe the embedding dimension once; empty collections stay
+        # unknown until the first insert records it
+        embeddings = collection.peek(limit=1).get("embeddings")
+        dim = len(embeddings[0]) if embeddings is not None and len(embeddings) else None
+        cached = self._coll_cache[collection_name] = (collection, dim)
+        self._known.add(collection_name)
+        return cached
 
     def add_to_collection(
         self, 
         collection_name: str, 
         chunks: List[str],
-        embeddings: List[List[float]],
+        embeddings: np.ndarray,
         metadata: List[Dict[str, Any]]
         ) -> List[str]:
-
-        if not self.client:
-            raise ConnectionError("Not connected to ChromaDB")
+        """
+        Add chunks to a collection in sub-batches of insert_batch_size.
         
+        The insert is all-or-nothing from the caller's point of view: if any
+        sub-batch fails, the sub-batches already stored are deleted again by
+        ID before the error is re-raised. If that cleanup also fails, it is
+        logged with the number of orphaned chunks.
+        """
         try:
-            collection = self._get_collection(collection_name)
-            
-            # Generate IDs for chunks
-            chunk_ids = [str(uuid.uuid4()) for _ in chunks]
-
-            # Store chunks with their embeddings
-            collection.add(
-                embeddings=embeddings,
-                documents=chunks,      # Store original text chunks
-                metadatas=metadata,
-                ids=chunk_ids
+            collection, dim = (
+                self._coll_cache.get(collection_name) or self._bind(collection_name)
             )
             
+            # Keep embeddings as one contiguous float32 block so sub-batches
+            # are cheap views rather than lists of boxed Python floats
+            embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+            if chunks and (embeddings.ndim != 2 or embeddings.shape[0] != len(chunks)):
+                raise ValueError(
+                    f"Expected embeddings of shape ({len(chunks)}, dim), "
+                    f"got {embeddings.shape}"
+                )
+            
+            # Generate 128-bit random hex IDs for chunks from a single
+            # urandom call rather than one uuid4() per chunk
+            random_bytes = os.urandom(16 * len(chunks))
+            chunk_ids = [
+                random_bytes[offset:offset + 16].hex()
+                for offset in range(0, len(random_bytes), 16)
+            ]
+
+            # Store chunks with their embeddings in fixed-size sub-batches;
+            # very large single add calls get disproportionately slow
+            batch_size = self.insert_batch_size
+            batch_starts = range(0, len(chunks), batch_size)
+
+            committed_starts = []
+
+            def add_batch(start: int) -> None:
+                end = start + batch_size
+                collection.add(
+                    embeddings=embeddings[start:end],
+                    documents=chunks[start:end],      # Store original text chunks
+                    metadatas=metadata[start:end],
+                    ids=chunk_ids[start:end]
+                )
+                committed_starts.append(start)
+
+            try:
+                if self.insert_concurrency > 1 and len(batch_starts) > 1:
+                    with ThreadPoolExecutor(max_workers=self.insert_concurrency) as executor:
+                        futures = [executor.submit(add_batch, start) for start in batch_starts]
+                        try:
+                            for future in futures:
+                                future.result()
+                        except Exception:
+                            # Skip sub-batches that have not started yet; the
+                            # executor still waits for the running ones
+                            for future in futures:
+                                future.cancel()
+                            raise
+                else:
+                    for start in batch_starts:
+                        add_batch(start)
+            except Exception:
+                # Remove the sub-batches that did make it in, so a failed call
+                # leaves no rows behind whose IDs the caller never received
+                committed_ids = [
+                    chunk_id
+                    for start in committed_starts
+                    for chunk_id in chunk_ids[start:start + batch_size]
+                ]
+                if committed_ids:
+                    try:
+                        collection.delete(ids=committed_ids)
+                    except Exception as rollback_error:
+                        logger.error(
+                            f"Failed to roll back {len(committed_ids)} chunks in "
+                            f"collection {collection_name}: {rollback_error}"
+                        )
+                raise
+
+            if dim is None and len(embeddings):
+                self._coll_cache[collection_name] = (collection, embeddings.shape[1])
+            
             logger.info(f"Added {len(chunks)} chunks to collection {collection_name}")
             return chunk_ids
             
@@ -116,44 +238,128 @@ class ChromaConnector(DBConnector):
             logger.error(f"Error adding chunks to collection {collection_name}: {e}")
             raise
 
+    def add_to_collection_async(
+        self,
+        collection_name: str,
+        chunks: List[str],
+        embeddings: np.ndarray,
+        metadata: List[Dict[str, Any]]
+        ) -> Future:
+        """
+        Queue add_to_collection on a background thread and return its future.
+        
+        Lets the caller embed the next batch while this one is inserted. At
+        most max_pending_inserts inserts are in flight; beyond that this call
+        blocks until the oldest one finishes. The returned future is the only
+        place an insert's result or error is reported (failures are also
+        logged); this method, flush() and disconnect() never re-raise them.
+        The passed arrays and lists must not be modified until the future is
+        done.
+        """
+        if not self.client:
+            raise ConnectionError("Not connected to ChromaDB")
+        
+        if self._insert_executor is None:
+            self._insert_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="chroma-insert"
+            )
+        
+        # Backpressure: forget finished inserts, then wait for the oldest one
+        # while the queue is full. Outcomes stay on the futures.
+        pending = self._pending_inserts
+        while pending and pending[0].done():
+            pending.popleft()
+        while len(pending) >= self.max_pending_inserts:
+            wait([pending.popleft()])
+        
+        future = self._insert_executor.submit(
+            self.add_to_collection,
+            collection_name,
+            chunks,
+            embeddings,
+            metadata
+        )
+        pending.append(future)
+        return future
+
+    def flush(self) -> None:
+        """
+        Wait for all queued background inserts to finish.
+        
+        Errors are not re-raised here; check the futures returned by
+        add_to_collection_async.
+        """
+        pending, self._pending_inserts = self._pending_inserts, deque()
+        wait(pending)
+
     def search_similar(
         self,
         collection_name: str,
-        query_embedding: List[float],
+        query_embedding: np.ndarray,
         k: int = 5
         ) -> List[Tuple[str, float, Dict[str, Any]]]:
 
-        if not self.client:
-            raise ConnectionError("Not connected to ChromaDB")
+        query_embedding = np.asarray(query_embedding, dtype=np.float32)
+        return self.search_similar_batch(
+            collection_name,
+            query_embedding.reshape(1, -1),
+            k
+        )[0]
+
+    def search_similar_batch(
+        self,
+        collection_name: str,
+        query_embeddings: np.ndarray,
+        k: int = 5
+        ) -> List[List[Tuple[str, float, Dict[str, Any]]]]:
+        """
+        Search for several query embeddings in a single query call.
         
+        Returns:
+            One list of (id, similarity_score, metadata) tuples per query,
+            in the same order as query_embeddings
+        """
         try:
-            collection = self._get_collection(collection_name)
-            expected_dim = self._collection_dimensions[collection_name]
+            collection, expected_dim = (
+                self._coll_cache.get(collection_name) or self._bind(collection_name)
+            )
+            query_embeddings = np.ascontiguousarray(query_embeddings, dtype=np.float32)
             
             # Validate query embedding dimension
-            if len(query_embedding) != expected_dim:
+            if query_embeddings.ndim != 2:
                 raise ValueError(
-                    f"Query embedding has dimension {len(query_embedding)}, "
+                    f"Expected query embeddings of shape (n_queries, dim), "
+                    f"got {query_embeddings.shape}"
+                )
+            if expected_dim is not None and query_embeddings.shape[1] != expected_dim:
+                raise ValueError(
+                    f"Query embedding has dimension {query_embeddings.shape[1]}, "
                     f"expected {expected_dim}"
                 )
             
             results = collection.query(
-                query_embeddings=[query_embedding],
+                query_embeddings=query_embeddings,
                 n_results=k,
                 include=['distances', 'metadatas']
             )
             
-            # Format results as (id, similarity_score, metadata) tuples
+            # Format results as (id, similarity_score, metadata) tuples,
+            # converting distances to similarity scores in one vectorized pass
             formatted_results = [
-                (id_, 1.0 - dist, meta)  # Convert distance to similarity score
-                for id_, dist, meta in zip(
-                    results['ids'][0],
-                    results['distances'][0],
-                    results['metadatas'][0]
+                list(zip(
+                    ids,
+                    (1.0 - np.asarray(distances, dtype=np.float32)).tolist(),
+                    metadatas
+                ))
+                for ids, distances, metadatas in zip(
+                    results['ids'],
+                    results['distances'],
+                    results['metadatas']
                 )
             ]
             
             return formatted_results
         except Exception as e:
             logger.error(f"Error searching in collection {collection_name}: {e}")
-            raise
\ No newline at end of file
+            raise
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any, Tuple
 import logging
+import numpy as np
 from dataclasses import dataclass
 from src.core.document import Document
 
@@ -47,7 +48,7 @@ class DBConnector(ABC):
         self, 
         collection_name: str, 
         chunks: List[str],           
-        embeddings: List[List[float]], 
+        embeddings: np.ndarray,      # float32 array of shape (n_chunks, dim)
         metadata: List[Dict[str, Any]] 
     ) -> List[str]:  
         """Add text chunks and their embeddings to a specific collection."""
@@ -58,7 +59,7 @@ class DBConnector(ABC):
     def search_similar(
         self,
         collection_name: str,
-        query_embedding: List[float],
+        query_embedding: np.ndarray,
         k: int = 5
     ) -> List[Tuple[str, float, Dict[str, Any]]]:
         """
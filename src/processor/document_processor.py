@@ -6,11 +6,15 @@ import sys
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.append(project_root)
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import logging
-import PyPDF2
+import mmap
+import multiprocessing
+import pypdfium2 as pdfium
 from pathlib import Path
-from typing import Dict, Any
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Union
 from src.core.document import Document 
 
 # Set up logging
@@ -22,15 +26,26 @@ logger = logging.getLogger(__name__)
 class DocumentProcessor:
     """Handles document preprocessing and loading."""
     
-    def convert_pdf_to_text(self, file_path: str) -> str:
-        """Convert PDF file to text while preserving basic structure."""
+    SUPPORTED_TEXT_SUFFIXES = ('.txt', '.text')
+    SUPPORTED_SUFFIXES = ('.pdf',) + SUPPORTED_TEXT_SUFFIXES
+
+    def convert_pdf_to_text(self, file_path: Union[str, bytes]) -> str:
+        """Convert PDF file (path or raw bytes) to text while preserving basic structure."""
         try:
-            text = ""
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n\n"
-            return text.strip()
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                # Collect page texts and join once instead of growing a string
+                pages = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    # PDFium ends lines with \r\n; normalise so blank lines
+                    # match the \n\n paragraph separator used for chunking
+                    pages.append(self._normalize_newlines(textpage.get_text_range()))
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+            return "\n\n".join(pages).strip()
         except Exception as e:
             logger.error(f"Error converting PDF to text: {e}")
             raise
@@ -39,27 +54,168 @@ class DocumentProcessor:
     def load_data(self, file_path: str) -> Document:
             """Load document from file and create Document object."""
             try:
-                path = Path(file_path)
-                if path.suffix.lower() == '.pdf':
+                if self._check_supported(file_path) == '.pdf':
                     content = self.convert_pdf_to_text(file_path)
-                elif path.suffix.lower() in ['.txt', '.text']:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
                 else:
-                    raise ValueError(f"Unsupported file format: {path.suffix}")
-                
-                # Basic metadata
-                metadata = {
-                    'source': file_path,
-                    'file_type': path.suffix.lower(),
-                    'file_name': path.name,
-                }
+                    content = self._read_text(file_path)
                 
-                return Document(content=content, metadata=metadata)
+                return self._create_document(file_path, content)
             except Exception as e:
                 logger.error(f"Error loading document: {e}")
                 raise
 
+    def batch_load(
+        self,
+        file_paths: List[str],
+        batch_size: int = 32
+    ) -> List[Document]:
+            """
+            Load many documents, overlapping file reads within each batch.
+            
+            Up to batch_size files are read concurrently so their I/O latency
+            overlaps; parsing then happens in order from the in-memory bytes.
+            
+            Args:
+                file_paths: Paths of the files to load
+                batch_size: Number of files read concurrently
+                
+            Returns:
+                List of Document objects in the same order as file_paths
+            """
+            try:
+                if batch_size < 1:
+                    raise ValueError("batch_size must be a positive integer")
+                suffixes = [self._check_supported(file_path) for file_path in file_paths]
+                
+                documents = []
+                with ThreadPoolExecutor(max_workers=batch_size) as executor:
+                    for start in range(0, len(file_paths), batch_size):
+                        batch = file_paths[start:start + batch_size]
+                        batch_suffixes = suffixes[start:start + batch_size]
+                        # PDFium is not thread-safe, so only the reads run in
+                        # the pool and parsing stays on this thread
+                        for file_path, suffix, data in zip(
+                            batch, batch_suffixes, executor.map(self._read_bytes, batch)
+                        ):
+                            if suffix == '.pdf':
+                                content = self.convert_pdf_to_text(data)
+                            else:
+                                content = self._decode_text(data)
+                            documents.append(self._create_document(file_path, content))
+                
+                logger.info(f"Loaded {len(documents)} documents")
+                return documents
+            except Exception as e:
+                logger.error(f"Error loading documents: {e}")
+                raise
+
+    def process_directory(
+        self,
+        file_paths: Iterable[str],
+        processes: int = 1,
+        batch_size: int = 32
+    ) -> Iterator[Document]:
+            """
+            Lazily load documents from an iterable of file paths.
+            
+            Documents are yielded as they are loaded so a caller that chunks
+            and stores each one never holds the whole corpus in memory. With
+            processes == 1, paths are loaded through batch_load, batch_size at
+            a time, so reads still overlap. With processes > 1, files are
+            parsed in a process pool, handed to workers batch_size at a time,
+            and yielded in completion order.
+            
+            Args:
+                file_paths: Paths of the files to load, e.g. from list_directory
+                processes: Number of worker processes used for parsing
+                batch_size: Files per batch_load call, or per pool task when
+                    processes > 1
+                
+            Returns:
+                Iterator of Document objects, one per file path
+            """
+            # Validate eagerly; a generator body would only run on first next()
+            if processes < 1:
+                raise ValueError("processes must be a positive integer")
+            if batch_size < 1:
+                raise ValueError("batch_size must be a positive integer")
+            return self._iter_documents(file_paths, processes, batch_size)
+
+    def _iter_documents(
+        self,
+        file_paths: Iterable[str],
+        processes: int,
+        batch_size: int
+    ) -> Iterator[Document]:
+            """Generator behind process_directory."""
+            if processes > 1:
+                with multiprocessing.Pool(processes) as pool:
+                    yield from pool.imap_unordered(
+                        self.load_data, file_paths, chunksize=batch_size
+                    )
+            else:
+                file_paths = iter(file_paths)
+                while batch := list(islice(file_paths, batch_size)):
+                    yield from self.batch_load(batch, batch_size)
+
+    def list_directory(self, directory: str) -> List[str]:
+            """List supported files in a directory (not recursive), sorted by name."""
+            file_paths = [
+                str(path) for path in sorted(Path(directory).iterdir())
+                if path.is_file() and self._is_supported(path)
+            ]
+            logger.info(f"Found {len(file_paths)} documents in {directory}")
+            return file_paths
+
+    def _is_supported(self, file_path: Union[str, Path]) -> bool:
+            """Whether the file extension is one this processor can load."""
+            return Path(file_path).suffix.lower() in self.SUPPORTED_SUFFIXES
+
+    def _check_supported(self, file_path: Union[str, Path]) -> str:
+            """Return the lowercase file extension, raising if it is unsupported."""
+            if not self._is_supported(file_path):
+                raise ValueError(f"Unsupported file format: {Path(file_path).suffix}")
+            return Path(file_path).suffix.lower()
+
+    @staticmethod
+    def _read_bytes(file_path: str) -> bytes:
+            """Read the whole file into memory."""
+            with open(file_path, 'rb') as f:
+                return f.read()
+
+    @staticmethod
+    def _read_text(file_path: str) -> str:
+            """Decode a UTF-8 text file straight from a read-only memory map."""
+            with open(file_path, 'rb') as f:
+                # mmap cannot map an empty file
+                if os.fstat(f.fileno()).st_size == 0:
+                    return ""
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return DocumentProcessor._decode_text(mm)
+
+    @staticmethod
+    def _decode_text(data: Union[bytes, mmap.mmap]) -> str:
+            """Decode UTF-8 bytes with the newline handling of text-mode reads."""
+            return DocumentProcessor._normalize_newlines(str(data, 'utf-8'))
+
+    @staticmethod
+    def _normalize_newlines(text: str) -> str:
+            """Translate \r\n and lone \r line endings to \n."""
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            return text
+
+    @staticmethod
+    def _create_document(file_path: str, content: str) -> Document:
+            """Create Document object with basic file metadata."""
+            path = Path(file_path)
+            metadata = {
+                'source': file_path,
+                'file_type': path.suffix.lower(),
+                'file_name': path.name,
+            }
+            return Document(content=content, metadata=metadata)
+
     def add_metadata(self, doc: Document, additional_metadata: Dict[str, Any]) -> Document:
             """Add or update document metadata."""
             doc.metadata.update(additional_metadata)
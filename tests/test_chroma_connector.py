@@ -0,0 +1,194 @@
+import importlib.util
+import logging
+import threading
+import unittest
+
+HAS_DEPS = all(
+    importlib.util.find_spec(name) is not None for name in ("chromadb", "numpy")
+)
+
+if HAS_DEPS:
+    import numpy as np
+    from src.database.chroma_connector.connector import ChromaConnector
+
+
+class FakeCollection:
+    """In-memory stand-in for a Chroma collection."""
+
+    def __init__(self, name, fail_on=None):
+        self.name = name
+        self.rows = {}
+        self.fail_on = fail_on or set()
+        self.add_calls = 0
+        self.gate = None  # threading.Event that add waits on, if set
+        self.lock = threading.Lock()
+
+    def add(self, embeddings, documents, metadatas, ids):
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        with self.lock:
+            self.add_calls += 1
+        if any(document in self.fail_on for document in documents):
+            raise RuntimeError(f"add failed for {documents}")
+        with self.lock:
+            for chunk_id, document in zip(ids, documents):
+                self.rows[chunk_id] = document
+
+    def delete(self, ids):
+        with self.lock:
+            for chunk_id in ids:
+                self.rows.pop(chunk_id, None)
+
+    def peek(self, limit=10):
+        return {"embeddings": []}
+
+
+class FakeClient:
+    """In-memory stand-in for a Chroma client."""
+
+    def __init__(self):
+        self.collections = {}
+
+    def list_collections(self):
+        return list(self.collections)
+
+    def create_collection(self, name):
+        if name in self.collections:
+            raise ValueError(f"Collection {name} already exists")
+        self.collections[name] = FakeCollection(name)
+        return self.collections[name]
+
+    def get_or_create_collection(self, name):
+        if name not in self.collections:
+            self.collections[name] = FakeCollection(name)
+        return self.collections[name]
+
+    def delete_collection(self, name):
+        del self.collections[name]
+
+
+def _connected(**kwargs):
+    connector = ChromaConnector("unused", **kwargs)
+    connector.client = FakeClient()
+    return connector
+
+
+def _inputs(documents):
+    documents = list(documents)
+    return (
+        documents,
+        np.ones((len(documents), 2), dtype=np.float32),
+        [{"i": i} for i in range(len(documents))],
+    )
+
+
+@unittest.skipUnless(HAS_DEPS, "chromadb and numpy are required")
+class AddToCollectionTest(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def test_inserts_in_sub_batches(self):
+        connector = _connected(insert_batch_size=3)
+        ids = connector.add_to_collection("docs", *_inputs(f"d{i}" for i in range(10)))
+        collection = connector.client.collections["docs"]
+        self.assertEqual(collection.add_calls, 4)
+        self.assertEqual(sorted(collection.rows), sorted(ids))
+
+    def test_failed_sub_batch_rolls_back_committed_ones(self):
+        for concurrency in (1, 3):
+            with self.subTest(insert_concurrency=concurrency):
+                connector = _connected(insert_batch_size=2, insert_concurrency=concurrency)
+                collection = connector.client.get_or_create_collection("docs")
+                collection.fail_on = {"d5"}
+                with self.assertRaises(RuntimeError):
+                    connector.add_to_collection("docs", *_inputs(f"d{i}" for i in range(8)))
+                self.assertEqual(collection.rows, {})
+
+
+@unittest.skipUnless(HAS_DEPS, "chromadb and numpy are required")
+class CreateCollectionTest(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def test_collection_created_by_another_client_is_not_an_error(self):
+        connector = _connected()
+        connector.client.create_collection("docs")
+        connector.create_collection("docs")
+        connector.create_collection("docs")
+        self.assertEqual(connector.client.list_collections(), ["docs"])
+        self.assertIn("docs", connector._known)
+
+
+@unittest.skipUnless(HAS_DEPS, "chromadb and numpy are required")
+class AddToCollectionAsyncTest(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.connector = _connected(max_pending_inserts=2)
+        self.collection = self.connector.client.get_or_create_collection("docs")
+
+    def test_blocks_when_backlog_is_full(self):
+        self.collection.gate = threading.Event()
+        first = self.connector.add_to_collection_async("docs", *_inputs(["a"]))
+        second = self.connector.add_to_collection_async("docs", *_inputs(["b"]))
+        submitter = threading.Thread(
+            target=self.connector.add_to_collection_async,
+            args=("docs", *_inputs(["c"]))
+        )
+        submitter.start()
+        submitter.join(timeout=0.2)
+        self.assertTrue(submitter.is_alive())
+        self.assertFalse(first.done())
+
+        self.collection.gate.set()
+        submitter.join(timeout=5)
+        self.assertFalse(submitter.is_alive())
+        self.connector.flush()
+        self.assertTrue(second.done())
+        self.assertEqual(sorted(self.collection.rows.values()), ["a", "b", "c"])
+
+    def test_errors_are_reported_only_on_the_future(self):
+        self.collection.fail_on = {"bad"}
+        failed = self.connector.add_to_collection_async("docs", *_inputs(["bad"]))
+        self.assertIsInstance(failed.exception(timeout=5), RuntimeError)
+
+        # Later submits, flush() and disconnect() do not re-raise it
+        succeeded = self.connector.add_to_collection_async("docs", *_inputs(["ok"]))
+        self.connector.flush()
+        self.assertEqual(len(succeeded.result()), 1)
+        self.connector.add_to_collection_async("docs", *_inputs(["bad"]))
+        self.connector.disconnect()
+        self.assertEqual(list(self.collection.rows.values()), ["ok"])
+
+    def test_disconnect_waits_for_queued_inserts(self):
+        self.collection.gate = threading.Event()
+        futures = [
+            self.connector.add_to_collection_async("docs", *_inputs([name]))
+            for name in ("a", "b")
+        ]
+        threading.Timer(0.1, self.collection.gate.set).start()
+        self.connector.disconnect()
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual(sorted(self.collection.rows.values()), ["a", "b"])
+        self.assertIsNone(self.connector.client)
+
+    def test_drop_collection_waits_for_queued_inserts(self):
+        self.collection.gate = threading.Event()
+        futures = [
+            self.connector.add_to_collection_async("docs", *_inputs([name]))
+            for name in ("a", "b")
+        ]
+        threading.Timer(0.1, self.collection.gate.set).start()
+        self.connector.drop_collection("docs")
+        self.assertTrue(all(future.done() for future in futures))
+        # The queued insert must not have recreated the dropped collection
+        self.assertNotIn("docs", self.connector.client.collections)
+
+
+if __name__ == "__main__":
+    unittest.main()
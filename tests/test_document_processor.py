@@ -0,0 +1,98 @@
+import importlib.util
+import logging
+import os
+import tempfile
+import unittest
+
+HAS_DEPS = importlib.util.find_spec("pypdfium2") is not None
+
+if HAS_DEPS:
+    from src.processor.document_processor import DocumentProcessor
+
+
+@unittest.skipUnless(HAS_DEPS, "pypdfium2 is required")
+class TextLoadingTest(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.processor = DocumentProcessor()
+
+    def _write(self, name, data):
+        path = os.path.join(self.dir, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_read_text_decodes_utf8(self):
+        path = self._write("a.txt", "héllo\n\nwörld".encode("utf-8"))
+        self.assertEqual(DocumentProcessor._read_text(path), "héllo\n\nwörld")
+
+    def test_read_text_empty_file(self):
+        path = self._write("empty.txt", b"")
+        self.assertEqual(DocumentProcessor._read_text(path), "")
+
+    def test_read_text_normalizes_newlines(self):
+        path = self._write("crlf.txt", b"a\r\n\r\nb\rc")
+        self.assertEqual(DocumentProcessor._read_text(path), "a\n\nb\nc")
+
+    def test_load_data_metadata(self):
+        path = self._write("doc.TXT", b"content")
+        doc = self.processor.load_data(path)
+        self.assertEqual(doc.content, "content")
+        self.assertEqual(
+            doc.metadata,
+            {"source": path, "file_type": ".txt", "file_name": "doc.TXT"}
+        )
+
+    def test_load_data_rejects_unsupported(self):
+        path = self._write("notes.md", b"x")
+        with self.assertRaises(ValueError):
+            self.processor.load_data(path)
+
+    def test_batch_load_keeps_order_across_batches(self):
+        paths = [self._write(f"{i}.txt", f"doc {i}\r\n".encode()) for i in range(7)]
+        docs = self.processor.batch_load(paths, batch_size=3)
+        self.assertEqual([doc.content for doc in docs], [f"doc {i}\n" for i in range(7)])
+        self.assertEqual([doc.metadata["source"] for doc in docs], paths)
+
+    def test_batch_load_validates_before_reading(self):
+        paths = [self._write("a.txt", b"a"), os.path.join(self.dir, "missing.md")]
+        with self.assertRaises(ValueError):
+            self.processor.batch_load(paths)
+
+    def test_list_directory_filters_and_sorts(self):
+        for name in ("b.txt", "a.text", "c.md", "d.pdf"):
+            self._write(name, b"x")
+        os.mkdir(os.path.join(self.dir, "sub.txt"))
+        names = [os.path.basename(p) for p in self.processor.list_directory(self.dir)]
+        self.assertEqual(names, ["a.text", "b.txt", "d.pdf"])
+
+    def test_process_directory_is_lazy_and_ordered(self):
+        paths = [self._write(f"{i}.txt", str(i).encode()) for i in range(5)]
+        documents = self.processor.process_directory(iter(paths), batch_size=2)
+        self.assertEqual(next(documents).content, "0")
+        self.assertEqual([doc.content for doc in documents], ["1", "2", "3", "4"])
+
+    def test_process_directory_with_processes(self):
+        paths = [self._write(f"{i}.txt", str(i).encode()) for i in range(5)]
+        documents = self.processor.process_directory(paths, processes=2)
+        self.assertEqual(sorted(doc.content for doc in documents), ["0", "1", "2", "3", "4"])
+
+    def test_process_directory_rejects_bad_arguments(self):
+        paths = [self._write("a.txt", b"a")]
+        for kwargs in ({"batch_size": 0}, {"processes": 0}):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                self.processor.process_directory(paths, **kwargs)
+
+    def test_batch_load_rejects_bad_batch_size(self):
+        paths = [self._write("a.txt", b"a")]
+        with self.assertRaises(ValueError):
+            self.processor.batch_load(paths, batch_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
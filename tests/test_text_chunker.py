@@ -0,0 +1,102 @@
+import logging
+import random
+import unittest
+
+from src.chunker.text_chunker import TextChunker, _split_offsets
+from src.core.document import Document
+
+
+def _reference_split(text, chunk_size, chunk_overlap, separator):
+    """Port of CharacterTextSplitter.split_text/_merge_splits from LangChain."""
+    splits = [s for s in (text.split(separator) if separator else list(text)) if s != ""]
+    separator_len = len(separator)
+    docs = []
+    current_doc = []
+    total = 0
+
+    def join(pieces):
+        doc = separator.join(pieces).strip()
+        return doc or None
+
+    for d in splits:
+        _len = len(d)
+        if total + _len + (separator_len if current_doc else 0) > chunk_size:
+            if current_doc:
+                doc = join(current_doc)
+                if doc is not None:
+                    docs.append(doc)
+                while total > chunk_overlap or (
+                    total + _len + (separator_len if current_doc else 0) > chunk_size
+                    and total > 0
+                ):
+                    total -= len(current_doc[0]) + (separator_len if len(current_doc) > 1 else 0)
+                    current_doc = current_doc[1:]
+        current_doc.append(d)
+        total += _len + (separator_len if len(current_doc) > 1 else 0)
+    doc = join(current_doc)
+    if doc is not None:
+        docs.append(doc)
+    return docs
+
+
+def _chunks(text, chunk_size, chunk_overlap, separator):
+    return [
+        text[start:end]
+        for start, end in _split_offsets(text, chunk_size, chunk_overlap, separator)
+    ]
+
+
+class SplitOffsetsTest(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def test_matches_character_text_splitter(self):
+        rng = random.Random(0)
+        for separator in ("\n\n", " "):
+            for _ in range(2000):
+                pieces = [
+                    "".join(rng.choice("ab c\n") for _ in range(rng.randint(1, 15)))
+                    for _ in range(rng.randint(0, 40))
+                ]
+                text = separator.join(pieces)
+                if separator * 2 in text:
+                    continue
+                chunk_size = rng.randint(1, 40)
+                chunk_overlap = rng.randint(0, chunk_size)
+                self.assertEqual(
+                    _chunks(text, chunk_size, chunk_overlap, separator),
+                    _reference_split(text, chunk_size, chunk_overlap, separator)
+                )
+
+    def test_empty_separator_splits_characters(self):
+        rng = random.Random(1)
+        for _ in range(500):
+            text = "".join(rng.choice("ab c") for _ in range(rng.randint(0, 60)))
+            chunk_size = rng.randint(1, 20)
+            chunk_overlap = rng.randint(0, chunk_size)
+            self.assertEqual(
+                _chunks(text, chunk_size, chunk_overlap, ""),
+                _reference_split(text, chunk_size, chunk_overlap, "")
+            )
+
+    def test_repeated_separators_count_towards_chunk_size(self):
+        text = "\n\n\n\n\n\n".join(["aaaa"] * 20)
+        chunks = _chunks(text, 20, 0, "\n\n")
+        self.assertTrue(chunks)
+        self.assertTrue(all(len(chunk) <= 20 for chunk in chunks))
+        self.assertEqual(chunks[0], "aaaa\n\n\n\n\n\naaaa")
+
+    def test_start_index_points_at_chunk(self):
+        text = "\n\n\n\n".join(["same text"] * 10)
+        chunker = TextChunker(chunk_size=25, chunk_overlap=10)
+        chunks = chunker.create_chunks(Document(content=text, metadata={}))
+        starts = [chunk.metadata["chunk_start_index"] for chunk in chunks]
+        self.assertEqual(starts, sorted(set(starts)))
+        for chunk, start in zip(chunks, starts):
+            self.assertEqual(text[start:start + len(chunk.content)], chunk.content)
+
+
+if __name__ == "__main__":
+    unittest.main()